@@ -12,19 +12,42 @@ Endpoints:
 - POST /predict    - Model inference
 - GET  /model/info - Model metadata
 - GET  /metrics    - Prometheus metrics
+
+Concurrent /predict calls are coalesced by a micro-batcher into a single
+forward pass (up to MAX_BATCH_SIZE rows): requests arriving while a forward
+pass runs are collected for the next one, and an idle service dispatches at
+once unless BATCH_MAX_WAIT_MS asks it to wait.
 """
 
 import os
+import asyncio
+import base64
+import binascii
+import hmac
 import logging
+import queue
+import threading
 import time
-import uuid
-from datetime import datetime
-from typing import Any, Optional
-from contextlib import asynccontextmanager
+from collections import OrderedDict
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Callable, Optional, Union, cast
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager, nullcontext
+from logging.handlers import QueueHandler, QueueListener
 from fastapi import FastAPI, Request, Depends, Security
 from fastapi.security import APIKeyHeader
 from fastapi.responses import PlainTextResponse, JSONResponse
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+import orjson
 import torch
 import numpy as np
 
@@ -32,6 +55,12 @@ import numpy as np
 # Configuration
 # -----------------------------------------------------------------------------
 
+# Read by the CUDA caching allocator when CUDA is first initialised;
+# expandable segments limit fragmentation from varying batch shapes
+os.environ.setdefault(
+    "PYTORCH_CUDA_ALLOC_CONF", "expandable_segments:True,max_split_size_mb:64"
+)
+
 MODEL_NAME = os.getenv("MODEL_NAME", "unknown")
 MODEL_VERSION = os.getenv("MODEL_VERSION", "unknown")
 MODEL_URI = os.getenv("MODEL_URI", "")
@@ -41,6 +70,46 @@ API_KEY = os.getenv("API_KEY", "")  # Empty = no auth required
 ENABLE_AUDIT_LOG = os.getenv("ENABLE_AUDIT_LOG", "true").lower() == "true"
 MAX_BATCH_SIZE = int(os.getenv("MAX_BATCH_SIZE", "100"))
 MAX_FEATURES = int(os.getenv("MAX_FEATURES", "1000"))
+MODEL_RUNTIME = os.getenv("MODEL_RUNTIME", "eager").lower()  # eager | compile | torchscript | onnx
+# Extra time to hold a batch open while the inference thread is idle. Requests
+# arriving during a forward pass are batched regardless, so 0 keeps low-load
+# latency minimal; raise it to trade latency for larger batches.
+BATCH_MAX_WAIT_MS = float(os.getenv("BATCH_MAX_WAIT_MS", "0"))
+QUANTIZE = os.getenv("QUANTIZE", "").lower()  # empty (FP32) | int8
+ENABLE_CUDA_GRAPHS = os.getenv("ENABLE_CUDA_GRAPHS", "true").lower() == "true"
+MODEL_DTYPE = os.getenv("MODEL_DTYPE", "fp16").lower()  # fp16 | bf16 | fp32 (CUDA only)
+PREDICT_CACHE_SIZE = int(os.getenv("PREDICT_CACHE_SIZE", "10000"))  # 0 = disabled
+METRICS_CACHE_TTL_SECONDS = float(os.getenv("METRICS_CACHE_TTL_SECONDS", "1.0"))  # 0 = disabled
+
+
+def _cpu_threads() -> int:
+    """Intra-op threads per worker: CPU_LIMIT (or the affinity mask) split across workers."""
+    cpus = int(float(os.getenv("CPU_LIMIT", "0")))
+    if cpus <= 0:
+        cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+    return max(1, cpus // max(1, workers))
+
+
+CPU_THREADS = _cpu_threads()
+
+# Fixed batch sizes used for warmup and, with shape-specialised runtimes,
+# as padding targets so compiled graphs are reused across requests
+BATCH_BUCKETS = tuple(sorted({b for b in (1, 8, 32) if b < MAX_BATCH_SIZE} | {MAX_BATCH_SIZE}))
+
+# JSON instances with at least this many values are converted and validated
+# on a worker thread; smaller inputs are cheaper to handle inline
+PREPARE_OFFLOAD_VALUES = 4096
+
+# Input shapes are fixed per bucket, so cuDNN's autotuned algorithm choice is
+# cached rather than churned; TF32 trades the last mantissa bits of FP32
+# matmuls for tensor-core throughput on Ampere and newer GPUs
+if torch.cuda.is_available():
+    torch.backends.cudnn.benchmark = True
+    torch.backends.cudnn.deterministic = False
+    torch.backends.cuda.matmul.allow_tf32 = True
+    torch.backends.cudnn.allow_tf32 = True
+    torch.set_float32_matmul_precision("high")
 
 logging.basicConfig(
     level=getattr(logging, LOG_LEVEL),
@@ -49,6 +118,13 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 audit_logger = logging.getLogger("audit")
 
+# Audit entries are serialised to JSON by AuditLog: write them verbatim rather
+# than nesting them inside the application log format
+_audit_handler = logging.StreamHandler()
+_audit_handler.setFormatter(logging.Formatter("%(message)s"))
+audit_logger.addHandler(_audit_handler)
+audit_logger.propagate = False
+
 # -----------------------------------------------------------------------------
 # Custom Exceptions
 # -----------------------------------------------------------------------------
@@ -115,103 +191,119 @@ class APIError(BaseModel):
 # Metrics (Prometheus format)
 # -----------------------------------------------------------------------------
 
+_METRIC_LABELS = ("model", "version")
+
+REQUESTS_TOTAL = Counter(
+    "inference_requests_total", "Total number of inference requests", _METRIC_LABELS
+)
+PREDICTIONS_TOTAL = Counter(
+    "inference_predictions_total", "Total successful predictions", _METRIC_LABELS
+)
+INSTANCES_TOTAL = Counter(
+    "inference_instances_total", "Total instances processed", _METRIC_LABELS
+)
+ERRORS_TOTAL = Counter(
+    "inference_errors_total", "Total prediction errors", _METRIC_LABELS
+)
+VALIDATION_ERRORS_TOTAL = Counter(
+    "inference_validation_errors_total", "Total validation errors", _METRIC_LABELS
+)
+AUTH_ERRORS_TOTAL = Counter(
+    "inference_auth_errors_total", "Total authentication errors", _METRIC_LABELS
+)
+REQUEST_DURATION = Histogram(
+    "inference_request_duration_seconds",
+    "Inference request duration in seconds",
+    _METRIC_LABELS,
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, float("inf")),
+)
+BATCH_SIZE = Histogram(
+    "inference_batch_size",
+    "Rows per forward pass after micro-batching",
+    _METRIC_LABELS,
+    buckets=tuple(sorted({1, 2, 4, 8, 16, 32, 64} | {MAX_BATCH_SIZE})) + (float("inf"),),
+)
+CACHE_HITS_TOTAL = Counter(
+    "inference_cache_hits_total", "Instances served from the prediction cache", _METRIC_LABELS
+)
+CACHE_MISSES_TOTAL = Counter(
+    "inference_cache_misses_total", "Instances that required a forward pass", _METRIC_LABELS
+)
+CUDA_MEMORY_RESERVED = Gauge(
+    "inference_cuda_memory_reserved_bytes",
+    "GPU memory held by the PyTorch caching allocator",
+    _METRIC_LABELS,
+)
+CUDA_MEMORY_ALLOCATED = Gauge(
+    "inference_cuda_memory_allocated_bytes",
+    "GPU memory occupied by live tensors",
+    _METRIC_LABELS,
+)
+
+
 class Metrics:
-    """Prometheus-style metrics collector with detailed tracking."""
+    """Records inference metrics into the Prometheus client registry."""
 
     def __init__(self):
-        self.request_count = 0
-        self.request_latency_sum = 0.0
-        self.prediction_count = 0
-        self.error_count = 0
-        self.validation_error_count = 0
-        self.auth_error_count = 0
-        self.instances_processed = 0
-        self.latency_histogram = {
-            "le_10ms": 0,
-            "le_50ms": 0,
-            "le_100ms": 0,
-            "le_500ms": 0,
-            "le_1000ms": 0,
-            "le_inf": 0
-        }
-
-    def record_request(self, latency: float, success: bool = True, instances: int = 0):
-        self.request_count += 1
-        self.request_latency_sum += latency
-        self.instances_processed += instances
-
-        # Update histogram (cumulative buckets - each bucket includes all values <= threshold)
-        latency_s = latency  # Already in seconds
-        if latency_s <= 0.01:
-            self.latency_histogram["le_10ms"] += 1
-        if latency_s <= 0.05:
-            self.latency_histogram["le_50ms"] += 1
-        if latency_s <= 0.1:
-            self.latency_histogram["le_100ms"] += 1
-        if latency_s <= 0.5:
-            self.latency_histogram["le_500ms"] += 1
-        if latency_s <= 1.0:
-            self.latency_histogram["le_1000ms"] += 1
-        # +Inf bucket always includes all observations
-        self.latency_histogram["le_inf"] += 1
+        # Model/version labels are fixed for the process: resolve each labelled
+        # child once (this also exports every series as 0 before first use)
+        labels = (MODEL_NAME, MODEL_VERSION)
+        self._requests = REQUESTS_TOTAL.labels(*labels)
+        self._predictions = PREDICTIONS_TOTAL.labels(*labels)
+        self._instances = INSTANCES_TOTAL.labels(*labels)
+        self._errors = ERRORS_TOTAL.labels(*labels)
+        self._validation_errors = VALIDATION_ERRORS_TOTAL.labels(*labels)
+        self._auth_errors = AUTH_ERRORS_TOTAL.labels(*labels)
+        self._duration = REQUEST_DURATION.labels(*labels)
+        self._batch_size = BATCH_SIZE.labels(*labels)
+        self._cache_hits = CACHE_HITS_TOTAL.labels(*labels)
+        self._cache_misses = CACHE_MISSES_TOTAL.labels(*labels)
+
+        # Rendered exposition reused by scrapes within cache_ttl seconds
+        self.cache_ttl = METRICS_CACHE_TTL_SECONDS
+        self._body: Optional[bytes] = None
+        self._rendered_at = 0.0
+
+        if torch.cuda.is_available():
+            # Sampled at scrape time; reserved minus allocated shows fragmentation
+            CUDA_MEMORY_RESERVED.labels(*labels).set_function(torch.cuda.memory_reserved)
+            CUDA_MEMORY_ALLOCATED.labels(*labels).set_function(torch.cuda.memory_allocated)
+
+    def record_request(self, latency_ns: int, success: bool = True, instances: int = 0):
+        self._requests.inc()
+        self._duration.observe(latency_ns / 1e9)
+        self._instances.inc(instances)
 
         if success:
-            self.prediction_count += 1
+            self._predictions.inc()
         else:
-            self.error_count += 1
+            self._errors.inc()
+
+    def record_batch(self, rows: int):
+        self._batch_size.observe(rows)
+
+    def record_cache(self, hits: int, misses: int):
+        self._cache_hits.inc(hits)
+        self._cache_misses.inc(misses)
+
+    def record_error(self):
+        self._errors.inc()
 
     def record_validation_error(self):
-        self.validation_error_count += 1
-        self.error_count += 1
+        self._validation_errors.inc()
+        self._errors.inc()
 
     def record_auth_error(self):
-        self.auth_error_count += 1
-        self.error_count += 1
-
-    def to_prometheus(self) -> str:
-        """Generate Prometheus-format metrics."""
-        labels = f'model="{MODEL_NAME}",version="{MODEL_VERSION}"'
-
-        def hist_labels(le: str) -> str:
-            return f'model="{MODEL_NAME}",version="{MODEL_VERSION}",le="{le}"'
-
-        lines = [
-            "# HELP inference_requests_total Total number of inference requests",
-            "# TYPE inference_requests_total counter",
-            f"inference_requests_total{{{labels}}} {self.request_count}",
-            "",
-            "# HELP inference_predictions_total Total successful predictions",
-            "# TYPE inference_predictions_total counter",
-            f"inference_predictions_total{{{labels}}} {self.prediction_count}",
-            "",
-            "# HELP inference_instances_total Total instances processed",
-            "# TYPE inference_instances_total counter",
-            f"inference_instances_total{{{labels}}} {self.instances_processed}",
-            "",
-            "# HELP inference_errors_total Total prediction errors",
-            "# TYPE inference_errors_total counter",
-            f"inference_errors_total{{{labels}}} {self.error_count}",
-            "",
-            "# HELP inference_validation_errors_total Total validation errors",
-            "# TYPE inference_validation_errors_total counter",
-            f"inference_validation_errors_total{{{labels}}} {self.validation_error_count}",
-            "",
-            "# HELP inference_auth_errors_total Total authentication errors",
-            "# TYPE inference_auth_errors_total counter",
-            f"inference_auth_errors_total{{{labels}}} {self.auth_error_count}",
-            "",
-            "# HELP inference_request_duration_seconds Inference request duration in seconds",
-            "# TYPE inference_request_duration_seconds histogram",
-            f'inference_request_duration_seconds_bucket{{{hist_labels("0.01")}}} {self.latency_histogram["le_10ms"]}',
-            f'inference_request_duration_seconds_bucket{{{hist_labels("0.05")}}} {self.latency_histogram["le_50ms"]}',
-            f'inference_request_duration_seconds_bucket{{{hist_labels("0.1")}}} {self.latency_histogram["le_100ms"]}',
-            f'inference_request_duration_seconds_bucket{{{hist_labels("0.5")}}} {self.latency_histogram["le_500ms"]}',
-            f'inference_request_duration_seconds_bucket{{{hist_labels("1.0")}}} {self.latency_histogram["le_1000ms"]}',
-            f'inference_request_duration_seconds_bucket{{{hist_labels("+Inf")}}} {self.latency_histogram["le_inf"]}',
-            f"inference_request_duration_seconds_sum{{{labels}}} {self.request_latency_sum:.6f}",
-            f"inference_request_duration_seconds_count{{{labels}}} {self.request_count}",
-        ]
-        return "\n".join(lines) + "\n"
+        self._auth_errors.inc()
+        self._errors.inc()
+
+    def to_prometheus(self) -> bytes:
+        """Generate Prometheus-format metrics, reusing a render younger than cache_ttl."""
+        now = time.monotonic()
+        if self._body is None or now - self._rendered_at >= self.cache_ttl:
+            self._body = generate_latest(REGISTRY)
+            self._rendered_at = now
+        return self._body
 
 
 metrics = Metrics()
@@ -220,6 +312,20 @@ metrics = Metrics()
 # Audit Logging
 # -----------------------------------------------------------------------------
 
+@lru_cache(maxsize=4)
+def _iso_second(second: int) -> str:
+    return datetime.fromtimestamp(second, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def iso_now() -> str:
+    """Current UTC time as ISO 8601 with microseconds and a Z suffix."""
+    # The date/time part only changes once per second; format it once and
+    # append the sub-second part with integer arithmetic
+    t = time.time_ns()
+    second, ns = divmod(t, 1_000_000_000)
+    return f"{_iso_second(second)}.{ns // 1000:06d}Z"
+
+
 class AuditLog:
     """Structured audit logging for compliance and debugging."""
 
@@ -238,7 +344,7 @@ class AuditLog:
         audit_entry = {
             "event": "prediction",
             "request_id": request_id,
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": iso_now(),
             "model_name": MODEL_NAME,
             "model_version": MODEL_VERSION,
             "client_ip": client_ip,
@@ -247,7 +353,7 @@ class AuditLog:
             "success": success,
             "error": error
         }
-        audit_logger.info(str(audit_entry))
+        audit_logger.info(orjson.dumps(audit_entry).decode())
 
     @staticmethod
     def log_auth_failure(request_id: str, client_ip: str, reason: str):
@@ -257,11 +363,11 @@ class AuditLog:
         audit_entry = {
             "event": "auth_failure",
             "request_id": request_id,
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": iso_now(),
             "client_ip": client_ip,
             "reason": reason
         }
-        audit_logger.warning(str(audit_entry))
+        audit_logger.warning(orjson.dumps(audit_entry).decode())
 
 
 # -----------------------------------------------------------------------------
@@ -270,6 +376,8 @@ class AuditLog:
 
 api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 
+_API_KEY_BYTES = API_KEY.encode()
+
 
 async def verify_api_key(
     request: Request,
@@ -288,7 +396,8 @@ async def verify_api_key(
         AuditLog.log_auth_failure(request_id, client_ip, "missing_api_key")
         raise AuthenticationError("API key is required")
 
-    if api_key != API_KEY:
+    # Constant-time comparison so response timing does not reveal the key
+    if not hmac.compare_digest(api_key.encode(), _API_KEY_BYTES):
         metrics.record_auth_error()
         AuditLog.log_auth_failure(request_id, client_ip, "invalid_api_key")
         raise AuthenticationError("Invalid API key")
@@ -300,14 +409,46 @@ async def verify_api_key(
 # Model Loading
 # -----------------------------------------------------------------------------
 
+class OnnxRuntimeModel:
+    """Callable adapter that runs an ONNX Runtime session on CPU tensors."""
+
+    def __init__(self, session: Any):
+        self.session = session
+
+    def __call__(self, x: torch.Tensor) -> torch.Tensor:
+        return torch.from_numpy(self.session.run(None, {"x": x.numpy()})[0])
+
+
 class ModelWrapper:
     """Wrapper for PyTorch model with inference logic."""
 
     def __init__(self):
-        self.model = None
+        # An nn.Module in eager mode; a compiled, scripted or ONNX Runtime
+        # callable once MODEL_RUNTIME converts it
+        self.model: Optional[Callable[..., torch.Tensor]] = None
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
         self.loaded = False
         self.input_features = 10  # Expected input size
+        self.dtype = torch.float32  # Precision of model weights and device inputs
+        self.quantized = False  # Linear weights are int8 (QUANTIZE=int8)
+        # Persistent input buffers, allocated once the device is known
+        self._host_buf: Optional[torch.Tensor] = None
+        self._device_buf: Optional[torch.Tensor] = None
+        self._host_np: Optional[np.ndarray] = None
+        # Pinned output buffers for D2H copies, sized on first use (CUDA only)
+        self._logits_host: Optional[torch.Tensor] = None
+        self._preds_host: Optional[torch.Tensor] = None
+        # Batch sizes to pad to; None runs every request at its own size
+        self._buckets: Optional[tuple[int, ...]] = None
+        # Captured CUDA graphs keyed by batch bucket: (graph, static output)
+        self._graphs: dict[int, tuple[Any, torch.Tensor]] = {}
+        # Dedicated CUDA stream for inference work
+        self._stream: Optional[torch.cuda.Stream] = None
+        # Serialises use of the shared buffers, cache and CUDA graphs; uncontended
+        # when calls come through the single inference thread
+        self._lock = threading.Lock()
+        # LRU of per-row results keyed by the staged (padded) row bytes
+        self._cache: Optional[OrderedDict[bytes, dict[str, Any]]] = None
 
     def load(self):
         """Load model from URI or use demo model."""
@@ -316,6 +457,8 @@ class ModelWrapper:
         logger.info(f"Device: {self.device}")
 
         try:
+            self._configure_threads()
+
             if MODEL_URI and MODEL_URI != "demo":
                 # In production, load from MLflow or S3
                 # self.model = mlflow.pytorch.load_model(MODEL_URI)
@@ -325,6 +468,15 @@ class ModelWrapper:
                 # Demo mode: create simple classifier
                 self._load_demo_model()
 
+            self._quantize()
+            self._apply_precision()
+            self._allocate_buffers()
+            if self.device == "cuda":
+                self._stream = torch.cuda.Stream()
+            self._apply_runtime()
+            self._capture_cuda_graphs()
+            # Results from a previously loaded model must not be served
+            self._cache = OrderedDict() if PREDICT_CACHE_SIZE > 0 else None
             self.loaded = True
             logger.info("Model loaded successfully")
 
@@ -341,12 +493,318 @@ class ModelWrapper:
             torch.nn.Linear(32, 16),
             torch.nn.ReLU(),
             torch.nn.Linear(16, 2),
-            torch.nn.Softmax(dim=1)
         ).to(self.device)
         self.model.eval()
 
-    def validate_input(self, features: list[list[float]]) -> None:
-        """Validate input features before prediction."""
+    def _configure_threads(self):
+        """Size PyTorch thread pools to this worker's CPU share to avoid oversubscription."""
+        if self.device != "cpu":
+            return
+
+        torch.set_num_threads(CPU_THREADS)
+        try:
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            # Can only be set once, before any inter-op parallel work has started
+            pass
+        logger.info(f"Using {CPU_THREADS} intra-op thread(s)")
+
+    def _quantize(self):
+        """Apply int8 dynamic quantization to Linear layers when QUANTIZE=int8 (CPU only)."""
+        if not QUANTIZE:
+            return
+
+        if QUANTIZE != "int8":
+            logger.warning(f"Unknown QUANTIZE '{QUANTIZE}', keeping FP32 weights")
+            return
+
+        if self.device != "cpu":
+            logger.warning("QUANTIZE=int8 is only supported on CPU, keeping FP32 weights")
+            return
+
+        # Int8 weights with FBGEMM/QNNPACK GEMM kernels; activations are
+        # quantized on the fly so no calibration pass is needed
+        self.model = torch.ao.quantization.quantize_dynamic(
+            self.model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+        self.quantized = True
+        logger.info("Applied int8 dynamic quantization")
+
+    def _apply_precision(self):
+        """Cast weights to MODEL_DTYPE on CUDA; CPU stays FP32."""
+        self.dtype = torch.float32
+        if self.device != "cuda":
+            return
+
+        dtypes = {"fp16": torch.float16, "bf16": torch.bfloat16, "fp32": torch.float32}
+        if MODEL_DTYPE not in dtypes:
+            logger.warning(f"Unknown MODEL_DTYPE '{MODEL_DTYPE}', using fp16")
+        dtype = dtypes.get(MODEL_DTYPE, torch.float16)
+
+        if dtype == torch.bfloat16 and not torch.cuda.is_bf16_supported():
+            logger.warning("bf16 is not supported on this GPU, using fp16")
+            dtype = torch.float16
+
+        # Half precision halves weight memory traffic and enables tensor cores
+        # on matmuls. Weights and inputs are cast outright (inputs during the
+        # H2D copy), so no autocast region is needed around the forward pass
+        self.model = self.model.to(dtype)
+        self.dtype = dtype
+        logger.info(f"Using {self.weight_dtype} weights on CUDA")
+
+    @property
+    def weight_dtype(self) -> str:
+        """Precision of the served weights, as reported by /model/info."""
+        if self.quantized:
+            return "int8"
+        return str(self.dtype).removeprefix("torch.")
+
+    def _allocate_buffers(self):
+        """Pre-allocate input buffers so predict() does no per-request allocation."""
+        # Host buffer is pinned on CUDA for async H2D copies; on CPU it is reused directly
+        shape = (MAX_BATCH_SIZE, self.input_features)
+        self._host_buf = torch.zeros(
+            shape, dtype=torch.float32, pin_memory=(self.device == "cuda")
+        )
+        if self.device == "cuda":
+            # FP32 -> model dtype conversion happens as part of the H2D copy
+            self._device_buf = torch.zeros(shape, dtype=self.dtype, device=self.device)
+        else:
+            self._device_buf = self._host_buf
+        # NumPy view for staging: plain array assignment, also from read-only arrays
+        self._host_np = self._host_buf.numpy()
+
+    def _apply_runtime(self):
+        """Convert the model according to MODEL_RUNTIME (falling back to eager) and warm it up."""
+        self._buckets = None
+        converters = {
+            "compile": self._compile_model,
+            "torchscript": self._script_model,
+            "onnx": self._onnx_model,
+        }
+
+        if MODEL_RUNTIME in converters:
+            eager_model = self.model
+            try:
+                self.model = converters[MODEL_RUNTIME](eager_model)
+                # Shape-specialised runtimes serve padded bucket sizes only; the
+                # ONNX graph is exported with a dynamic batch axis
+                self._buckets = BATCH_BUCKETS if MODEL_RUNTIME != "onnx" else None
+                # Converted runtimes may only fail on first run, so the warmup
+                # doubles as the check that decides whether to fall back
+                self._warmup()
+                return
+            except Exception as e:
+                logger.warning(f"MODEL_RUNTIME={MODEL_RUNTIME} failed, falling back to eager: {e}")
+                self.model = eager_model
+                self._buckets = None
+        elif MODEL_RUNTIME != "eager":
+            logger.warning(f"Unknown MODEL_RUNTIME '{MODEL_RUNTIME}', using eager")
+
+        self._warmup()
+
+    @staticmethod
+    def _compile_model(model: torch.nn.Module) -> Callable[..., torch.Tensor]:
+        # dynamic=False specialises on the bucket shapes; reduce-overhead
+        # additionally captures CUDA graphs on GPU
+        return torch.compile(model, mode="reduce-overhead", fullgraph=True, dynamic=False)
+
+    @staticmethod
+    def _script_model(model: torch.nn.Module) -> torch.nn.Module:
+        # Freezing inlines weights as constants so optimize_for_inference can
+        # fold them and fuse Linear+ReLU into oneDNN/cuBLAS primitives
+        return torch.jit.optimize_for_inference(torch.jit.freeze(torch.jit.script(model)))
+
+    def _onnx_model(self, model: torch.nn.Module) -> OnnxRuntimeModel:
+        if self.device != "cpu":
+            raise RuntimeError("the ONNX Runtime path is CPU only")
+
+        # Optional dependency, only needed for MODEL_RUNTIME=onnx
+        import onnxruntime as ort
+
+        # load() allocates the buffers before converting the model
+        device_buf = self._device_buf
+        assert device_buf is not None
+
+        # Export in memory (the root filesystem is read-only in the cluster) with
+        # the torch.export-based exporter; the example batch is 2 because export
+        # specialises size-1 dims. ORT's graph optimiser then fuses Linear+ReLU
+        # into single GEMM kernels
+        program = torch.onnx.export(
+            model,
+            (device_buf[:2],),
+            input_names=["x"],
+            output_names=["logits"],
+            dynamic_shapes=({0: torch.export.Dim("batch")},),
+            dynamo=True,
+            verbose=False,
+        )
+        if program is None:
+            raise RuntimeError("torch.onnx.export returned no ONNX program")
+
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = CPU_THREADS
+        options.inter_op_num_threads = 1
+        session = ort.InferenceSession(
+            program.model_proto.SerializeToString(), options, providers=["CPUExecutionProvider"]
+        )
+        return OnnxRuntimeModel(session)
+
+    def _warmup(self):
+        """Run each batch bucket a few times before readiness, under the serving grad mode.
+
+        This finishes compilation/profiling for optimised runtimes and, on CUDA,
+        populates the caching allocator so serving does not stall on cudaMalloc.
+        """
+        start_time = time.time()
+        with torch.inference_mode():
+            # The TorchScript profiling executor re-optimises after the first runs of a shape
+            for _ in range(3):
+                for batch_size in BATCH_BUCKETS:
+                    self.model(self._device_buf[:batch_size])
+        if self.device == "cuda":
+            torch.cuda.synchronize()
+        logger.info(f"Model warmup completed in {(time.time() - start_time) * 1000:.1f}ms")
+
+    def _capture_cuda_graphs(self):
+        """Capture one CUDA graph per batch bucket so a forward is a single graph launch."""
+        self._graphs = {}
+        # torch.compile's reduce-overhead mode already captures its own graphs
+        if not ENABLE_CUDA_GRAPHS or self.device != "cuda" or MODEL_RUNTIME == "compile":
+            return
+
+        try:
+            # Capture requires warm-up iterations on a side stream first
+            stream = torch.cuda.Stream()
+            stream.wait_stream(torch.cuda.current_stream())
+            with torch.cuda.stream(stream), torch.inference_mode():
+                for batch_size in BATCH_BUCKETS:
+                    for _ in range(3):
+                        self.model(self._device_buf[:batch_size])
+            torch.cuda.current_stream().wait_stream(stream)
+
+            # Graph inputs are views of the persistent device buffer, so staging
+            # a request is all that is needed before replay. Buckets share one
+            # memory pool since they are never replayed concurrently.
+            pool = torch.cuda.graph_pool_handle()
+            with torch.inference_mode():
+                for batch_size in BATCH_BUCKETS:
+                    graph = torch.cuda.CUDAGraph()
+                    with torch.cuda.graph(graph, pool=pool):
+                        static_out = self.model(self._device_buf[:batch_size])
+                    self._graphs[batch_size] = (graph, static_out)
+        except Exception as e:
+            logger.warning(f"CUDA graph capture failed, using eager launches: {e}")
+            self._graphs = {}
+            return
+
+        self._buckets = BATCH_BUCKETS
+        logger.info(f"Captured CUDA graphs for batch sizes {list(self._graphs)}")
+
+    def _stage_input(self, host: np.ndarray, batch: list[np.ndarray]) -> int:
+        """Copy arrays into consecutive buffer rows, zero-padding or truncating to input_features."""
+        n = 0
+        for arr in batch:
+            rows = arr.shape[0]
+            k = min(arr.shape[1], self.input_features)
+            host[n:n + rows, :k] = arr[:, :k]
+            if k < self.input_features:
+                host[n:n + rows, k:] = 0.0
+            n += rows
+        return n
+
+    @staticmethod
+    def _upload(host_buf: torch.Tensor, device_buf: torch.Tensor, n: int):
+        """Copy the first n staged rows to the device buffer (no-op on CPU)."""
+        if device_buf is not host_buf:
+            device_buf[:n].copy_(host_buf[:n], non_blocking=True)
+
+    def _cache_lookup(
+        self, host: np.ndarray, n: int
+    ) -> tuple[list[Optional[dict[str, Any]]], list[int], list[bytes]]:
+        """Look up the first n staged rows, returning (results, miss indices, miss keys)."""
+        if self._cache is None:
+            return [None] * n, list(range(n)), []
+
+        results = []
+        misses = []
+        keys = []
+        for i, row in enumerate(host[:n]):
+            key = row.tobytes()
+            result = self._cache.get(key)
+            if result is None:
+                misses.append(i)
+                keys.append(key)
+            else:
+                self._cache.move_to_end(key)
+            results.append(result)
+
+        metrics.record_cache(n - len(misses), len(misses))
+        return results, misses, keys
+
+    def _cache_store(self, keys: list[bytes], results: list[dict[str, Any]]):
+        if self._cache is None:
+            return
+        for key, result in zip(keys, results):
+            self._cache[key] = result
+        while len(self._cache) > PREDICT_CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+    def _to_host(self, logits: torch.Tensor, preds: torch.Tensor) -> tuple[np.ndarray, np.ndarray]:
+        """Copy logits and predicted classes to the host with a single synchronisation."""
+        if self._stream is None:
+            return logits.float().numpy(), preds.numpy()
+
+        n, width = logits.shape
+        if self._logits_host is None or self._preds_host is None or self._logits_host.shape[1] != width:
+            self._logits_host = torch.empty((MAX_BATCH_SIZE, width), dtype=torch.float32, pin_memory=True)
+            self._preds_host = torch.empty(MAX_BATCH_SIZE, dtype=torch.int64, pin_memory=True)
+
+        # Both copies are queued on the inference stream; one sync covers them.
+        # The returned views are consumed before the next batch reuses the buffers.
+        self._logits_host[:n].copy_(logits, non_blocking=True)
+        self._preds_host[:n].copy_(preds, non_blocking=True)
+        self._stream.synchronize()
+        return self._logits_host[:n].numpy(), self._preds_host[:n].numpy()
+
+    def _forward(self, device_buf: torch.Tensor, n: int) -> torch.Tensor:
+        """Run the model on the first n staged rows."""
+        rows = n
+        if self._buckets is not None:
+            # Pad up to the nearest bucket; extra rows are ignored
+            rows = next(b for b in self._buckets if b >= n)
+
+        graph = self._graphs.get(rows)
+        if graph is not None:
+            graph[0].replay()
+            return graph[1][:n]
+        assert self.model is not None
+        return self.model(device_buf[:rows])[:n]
+
+    def validate_input(self, features: list[list[float]]) -> np.ndarray:
+        """Validate input features and return them as a float32 array."""
+        # Fast path: one C-level conversion and a vectorised finiteness check.
+        # Anything that does not convert to a numeric 2-D array is re-walked
+        # element by element only to report where it went wrong.
+        try:
+            arr = np.asarray(features)
+        except (ValueError, TypeError):
+            arr = None
+
+        if arr is None or arr.ndim != 2 or arr.dtype.kind not in "biuf":
+            self._locate_invalid(features)
+            # Structurally valid but still not convertible (e.g. nested deeper)
+            raise ValidationError(
+                "Instances must be a 2-D list of numbers",
+                {"field": "instances"}
+            )
+
+        arr = arr.astype(np.float32, copy=False)
+        self.validate_array(arr)
+        return arr
+
+    def _locate_invalid(self, features: list[list[float]]) -> None:
+        """Per-element checks used to pinpoint the first invalid value."""
         if not features:
             raise ValidationError(
                 "Empty instances list",
@@ -366,6 +824,12 @@ class ModelWrapper:
                     {"field": f"instances[{i}]", "expected": "list", "actual": type(instance).__name__}
                 )
 
+            if len(instance) != len(features[0]):
+                raise ValidationError(
+                    f"Instance {i} has {len(instance)} features, expected {len(features[0])}",
+                    {"field": f"instances[{i}]", "expected": len(features[0]), "actual": len(instance)}
+                )
+
             if len(instance) > MAX_FEATURES:
                 raise ValidationError(
                     f"Instance {i} has {len(instance)} features, maximum is {MAX_FEATURES}",
@@ -385,78 +849,359 @@ class ModelWrapper:
                         {"field": f"instances[{i}][{j}]", "value": str(value)}
                     )
 
-    def predict(self, features: list[list[float]]) -> list[dict[str, Any]]:
-        """Run inference on input features."""
+    def validate_array(self, arr: np.ndarray) -> None:
+        """Validate an already-decoded (rows, features) float array."""
+        if arr.ndim != 2 or arr.shape[0] == 0:
+            raise ValidationError(
+                "Instances must be a non-empty 2-D array",
+                {"field": "instances", "shape": list(arr.shape)}
+            )
+
+        if arr.shape[0] > MAX_BATCH_SIZE:
+            raise ValidationError(
+                f"Batch size {arr.shape[0]} exceeds maximum {MAX_BATCH_SIZE}",
+                {"field": "instances", "max_batch_size": MAX_BATCH_SIZE, "actual": arr.shape[0]}
+            )
+
+        if arr.shape[1] > MAX_FEATURES:
+            raise ValidationError(
+                f"Instances have {arr.shape[1]} features, maximum is {MAX_FEATURES}",
+                {"field": "instances", "max_features": MAX_FEATURES, "actual": arr.shape[1]}
+            )
+
+        finite = np.isfinite(arr)
+        if not finite.all():
+            i, j = np.argwhere(~finite)[0]
+            raise ValidationError(
+                f"Instance {i}, feature {j} is not finite (NaN or Inf)",
+                {"field": f"instances[{i}][{j}]", "value": str(arr[i, j])}
+            )
+
+    def prepare(self, features: Union[list[list[float]], np.ndarray]) -> np.ndarray:
+        """Validate input features and convert them to a float32 array."""
+        if isinstance(features, np.ndarray):
+            self.validate_array(features)
+            return features
+
+        return self.validate_input(features)
+
+    def predict_batch(self, batch: list[np.ndarray]) -> list[list[dict[str, Any]]]:
+        """Run one forward pass over several prepared inputs, returning results per input."""
         if not self.loaded:
             raise ModelNotLoadedError()
 
-        # Validate input
-        self.validate_input(features)
+        with self._lock:
+            return self._run_batch(batch)
+
+    def _run_batch(self, batch: list[np.ndarray]) -> list[list[dict[str, Any]]]:
+        # The buffers are allocated by load(), which predict_batch() has checked
+        host_np, host_buf, device_buf = self._host_np, self._host_buf, self._device_buf
+        assert host_np is not None and host_buf is not None and device_buf is not None
 
+        # Issue work on the inference stream; _to_host() synchronises on it once
+        stream_ctx = torch.cuda.stream(self._stream) if self._stream is not None else nullcontext()
         try:
-            with torch.no_grad():
-                # Convert to tensor
-                input_tensor = torch.tensor(features, dtype=torch.float32).to(self.device)
-
-                # Ensure correct input shape (pad if needed for demo)
-                if input_tensor.shape[1] < self.input_features:
-                    padding = torch.zeros(
-                        input_tensor.shape[0],
-                        self.input_features - input_tensor.shape[1]
-                    ).to(self.device)
-                    input_tensor = torch.cat([input_tensor, padding], dim=1)
-                elif input_tensor.shape[1] > self.input_features:
-                    input_tensor = input_tensor[:, :self.input_features]
+            # inference_mode skips autograd version counting and view tracking;
+            # tensors created here are inference tensors and never reach autograd
+            with stream_ctx, torch.inference_mode():
+                # Stage into pre-allocated buffers (handles padding/truncation)
+                n = self._stage_input(host_np, batch)
+
+                # Serve repeated rows from the cache; only misses reach the model
+                results, misses, keys = self._cache_lookup(host_np, n)
+                if not misses:
+                    # Every row was a cache hit, so every slot is filled
+                    return self._split(batch, cast(list[dict[str, Any]], results))
+
+                m = len(misses)
+                if m < n:
+                    # Compact the rows to compute to the front of the buffer
+                    host_np[:m] = host_np[misses]
+                self._upload(host_buf, device_buf, m)
 
                 # Run inference
-                outputs = self.model(input_tensor)
-
-                # Format results
-                results = []
-                for i, output in enumerate(outputs.cpu().numpy()):
-                    prediction = int(np.argmax(output))
-                    confidence = float(np.max(output))
-                    results.append({
-                        "prediction": prediction,
-                        "confidence": confidence,
-                        "probabilities": output.tolist()
-                    })
-
-                return results
-
-        except ValidationError:
-            raise
+                outputs = self._forward(device_buf, m)
+
+                # The model emits logits: argmax is taken on them directly (on the
+                # device) and softmax is only computed on the host for the
+                # reported probabilities
+                preds_t = outputs.argmax(dim=1)
+                logits, preds = self._to_host(outputs, preds_t)
+                probs = np.exp(logits - logits.max(axis=1, keepdims=True))
+                probs /= probs.sum(axis=1, keepdims=True)
+
+                # Format results (vectorised over the batch)
+                confs = probs[np.arange(probs.shape[0]), preds]
+                computed = [
+                    {"prediction": pred, "confidence": conf, "probabilities": row}
+                    for pred, conf, row in zip(preds.tolist(), confs.tolist(), probs.tolist())
+                ]
+
+            # Cached dicts are shared between responses and never mutated
+            self._cache_store(keys, computed)
+            for i, result in zip(misses, computed):
+                results[i] = result
+
         except Exception as e:
             raise PredictionError(f"Inference failed: {str(e)}")
 
+        # Hits were filled by the lookup and misses by the forward pass
+        return self._split(batch, cast(list[dict[str, Any]], results))
+
+    @staticmethod
+    def _split(batch: list[np.ndarray], results: list[dict[str, Any]]) -> list[list[dict[str, Any]]]:
+        """Split per-row results back out per input."""
+        split = []
+        offset = 0
+        for arr in batch:
+            split.append(results[offset:offset + arr.shape[0]])
+            offset += arr.shape[0]
+        return split
+
+    def predict(self, features: list[list[float]]) -> list[dict[str, Any]]:
+        """Run inference on input features."""
+        if not self.loaded:
+            raise ModelNotLoadedError()
+
+        return self.predict_batch([self.prepare(features)])[0]
+
 
 model_wrapper = ModelWrapper()
 
+# -----------------------------------------------------------------------------
+# Micro-batching
+# -----------------------------------------------------------------------------
+
+class MicroBatcher:
+    """Coalesces concurrent prediction requests into a single forward pass."""
+
+    def __init__(
+        self,
+        wrapper: ModelWrapper,
+        max_batch_size: int,
+        max_wait_ms: float,
+        executor: Optional[ThreadPoolExecutor] = None
+    ):
+        self.wrapper = wrapper
+        self.executor = executor
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        # Replaced in start(): a queue is tied to the event loop that first uses it
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        """Start the batching loop on the running event loop."""
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the batching loop and fail any requests still queued."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(ModelNotLoadedError("Service is shutting down"))
+
+    async def submit(self, arr: np.ndarray) -> list[dict[str, Any]]:
+        """Queue a prepared input and wait for its share of the batch results."""
+        if not self.running:
+            # No batching loop (e.g. app used without lifespan): predict directly
+            results = await asyncio.get_running_loop().run_in_executor(
+                self.executor, self.wrapper.predict_batch, [arr]
+            )
+            return results[0]
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((arr, future))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        pending = None
+        batch: list[tuple[np.ndarray, asyncio.Future]] = []
+        inflight: Optional[asyncio.Task] = None
+        inflight_batch: list[tuple[np.ndarray, asyncio.Future]] = []
+
+        try:
+            while True:
+                item = pending or await self._queue.get()
+                pending = None
+                batch = [item]
+                rows = item[0].shape[0]
+                deadline = loop.time() + self.max_wait
+
+                # Take what is already queued, then keep collecting only while the
+                # previous forward pass is still running or max_wait has not elapsed
+                while rows < self.max_batch_size:
+                    try:
+                        item = self._queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        item = await self._next_item(inflight, deadline)
+                        if item is None:
+                            break
+
+                    if rows + item[0].shape[0] > self.max_batch_size:
+                        # Does not fit in the input buffer; carry over to the next batch
+                        pending = item
+                        break
+                    batch.append(item)
+                    rows += item[0].shape[0]
+
+                if inflight is not None:
+                    try:
+                        await inflight
+                    except Exception as e:
+                        # Never let one bad batch stop the loop for everyone after it
+                        logger.exception("Micro-batch dispatch failed")
+                        self._fail(inflight_batch, e)
+
+                # Start the forward pass without awaiting it, so the next batch
+                # collects while this one runs
+                inflight_batch, batch = batch, []
+                inflight = asyncio.create_task(self._dispatch(inflight_batch))
+        finally:
+            # Cancelled (stop()) mid-collection or mid-forward pass: release those callers
+            if inflight is not None:
+                inflight.cancel()
+            if pending is not None:
+                batch.append(pending)
+            self._fail(batch + inflight_batch, ModelNotLoadedError("Service is shutting down"))
+
+    async def _next_item(
+        self, inflight: Optional[asyncio.Task], deadline: float
+    ) -> Optional[tuple[np.ndarray, asyncio.Future]]:
+        """Wait for another request while a forward pass is running or until the deadline."""
+        loop = asyncio.get_running_loop()
+        while True:
+            busy = inflight is not None and not inflight.done()
+            timeout = deadline - loop.time()
+            if not busy and timeout <= 0:
+                return None
+
+            getter = asyncio.ensure_future(self._queue.get())
+            waiters: set[asyncio.Future] = {getter}
+            if busy:
+                assert inflight is not None
+                waiters.add(inflight)
+            try:
+                done, _ = await asyncio.wait(
+                    waiters,
+                    timeout=None if busy else timeout,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+            finally:
+                # Cancelling a pending Queue.get leaves the item in the queue
+                if not getter.done():
+                    getter.cancel()
+            if getter in done:
+                return getter.result()
+            # The forward pass finished first; re-check the deadline
+
+    async def _dispatch(self, batch: list[tuple[np.ndarray, asyncio.Future]]):
+        # Skip requests whose callers have gone away
+        batch = [(arr, future) for arr, future in batch if not future.done()]
+        if not batch:
+            return
+
+        try:
+            # Run the forward pass off the event loop so request I/O keeps flowing;
+            # requests arriving meanwhile queue up for the next batch
+            results = await asyncio.get_running_loop().run_in_executor(
+                self.executor, self.wrapper.predict_batch, [arr for arr, _ in batch]
+            )
+        except Exception as e:
+            self._fail(batch, e)
+            return
+
+        metrics.record_batch(sum(arr.shape[0] for arr, _ in batch))
+        for (_, future), result in zip(batch, results):
+            # The caller may have been cancelled while the forward pass ran
+            if not future.done():
+                future.set_result(result)
+
+    @staticmethod
+    def _fail(batch: list[tuple[np.ndarray, asyncio.Future]], error: Exception):
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+
+
+# A single inference thread keeps device work serialised and owns the input buffers
+INFER_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="inference")
+
+batcher = MicroBatcher(model_wrapper, MAX_BATCH_SIZE, BATCH_MAX_WAIT_MS, INFER_POOL)
+
 # -----------------------------------------------------------------------------
 # Lifespan Management
 # -----------------------------------------------------------------------------
 
+@contextmanager
+def _deferred_audit_log():
+    """Hand audit records to a background thread so requests never wait on stream writes."""
+    audit_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(audit_queue)
+    listener = QueueListener(audit_queue, _audit_handler)
+
+    audit_logger.removeHandler(_audit_handler)
+    audit_logger.addHandler(queue_handler)
+    listener.start()
+    try:
+        yield
+    finally:
+        # stop() drains records still queued before returning
+        audit_logger.removeHandler(queue_handler)
+        audit_logger.addHandler(_audit_handler)
+        listener.stop()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifespan - load model on startup."""
     logger.info("Starting inference service...")
     try:
-        model_wrapper.load()
+        # Skip the (warmup-heavy) load if the wrapper was already loaded in-process
+        if not model_wrapper.loaded:
+            model_wrapper.load()
     except Exception as e:
         logger.error(f"Failed to initialize model: {e}")
         # Continue anyway for health check visibility
-    yield
-    logger.info("Shutting down inference service...")
+    batcher.start()
+    with _deferred_audit_log():
+        yield
+        logger.info("Shutting down inference service...")
+        await batcher.stop()
 
 # -----------------------------------------------------------------------------
 # FastAPI Application
 # -----------------------------------------------------------------------------
 
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (C implementation, fast float formatting)."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
 app = FastAPI(
     title="ML Inference Service",
     description="Zero-touch deployed ML inference endpoint",
     version=MODEL_VERSION,
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # -----------------------------------------------------------------------------
@@ -466,7 +1211,8 @@ app = FastAPI(
 @app.middleware("http")
 async def add_request_id(request: Request, call_next):
     """Add unique request ID to each request."""
-    request_id = str(uuid.uuid4())[:8]
+    # Same 32 bits of randomness as a truncated uuid4, without formatting a full UUID
+    request_id = os.urandom(4).hex()
     request.state.request_id = request_id
 
     response = await call_next(request)
@@ -478,22 +1224,83 @@ async def add_request_id(request: Request, call_next):
 # -----------------------------------------------------------------------------
 
 class PredictionRequest(BaseModel):
-    """Input for prediction endpoint."""
-    instances: list[list[float]] = Field(
-        ...,
+    """Input for prediction endpoint.
+
+    Either `instances` (JSON lists) or `instances_b64` + `shape` (base64 of a
+    row-major little-endian float32 matrix) must be provided. The binary form
+    skips per-number JSON parsing for large batches.
+    """
+    instances: Optional[list[list[float]]] = Field(
+        default=None,
         description="List of feature vectors for prediction",
         examples=[[[1.0, 2.0, 3.0, 4.0, 5.0]]]
     )
+    instances_b64: Optional[str] = Field(
+        default=None,
+        description="Base64-encoded little-endian float32 feature matrix"
+    )
+    shape: Optional[tuple[int, int]] = Field(
+        default=None,
+        description="(instances, features) shape of instances_b64"
+    )
+
+    _array: Optional[np.ndarray] = PrivateAttr(default=None)
 
     @field_validator('instances')
     @classmethod
     def validate_instances(cls, v):
+        if v is None:
+            return v
         if not v:
             raise ValueError("instances cannot be empty")
         if len(v) > MAX_BATCH_SIZE:
             raise ValueError(f"batch size exceeds maximum of {MAX_BATCH_SIZE}")
+        # Rows must form a rectangular matrix; reject before any array is built
+        width = len(v[0])
+        if width > MAX_FEATURES:
+            raise ValueError(f"feature count exceeds maximum of {MAX_FEATURES}")
+        for i, row in enumerate(v):
+            if len(row) != width:
+                raise ValueError(f"instance {i} has {len(row)} features, expected {width}")
         return v
 
+    @model_validator(mode="after")
+    def validate_payload(self):
+        if (self.instances is None) == (self.instances_b64 is None):
+            raise ValueError("exactly one of instances or instances_b64 is required")
+        if self.instances_b64 is None:
+            return self
+
+        if self.shape is None:
+            raise ValueError("shape is required with instances_b64")
+        rows, cols = self.shape
+        if not 1 <= rows <= MAX_BATCH_SIZE:
+            raise ValueError(f"batch size must be between 1 and {MAX_BATCH_SIZE}")
+        if not 1 <= cols <= MAX_FEATURES:
+            raise ValueError(f"feature count must be between 1 and {MAX_FEATURES}")
+
+        try:
+            buf = base64.b64decode(self.instances_b64, validate=True)
+        except binascii.Error:
+            raise ValueError("instances_b64 is not valid base64")
+        if len(buf) != rows * cols * 4:
+            raise ValueError(
+                f"instances_b64 has {len(buf)} bytes, expected {rows * cols * 4} for shape {self.shape}"
+            )
+
+        # Zero-copy view over the decoded bytes
+        self._array = np.frombuffer(buf, dtype="<f4").reshape(rows, cols)
+        return self
+
+    @property
+    def features(self) -> Union[list[list[float]], np.ndarray]:
+        """Feature matrix from whichever encoding was provided."""
+        if self.instances is not None:
+            return self.instances
+        # validate_payload decoded instances_b64, the only other encoding
+        assert self._array is not None
+        return self._array
+
 
 class PredictionResult(BaseModel):
     """Single prediction result."""
@@ -521,6 +1328,7 @@ class ModelInfo(BaseModel):
     device: str
     input_features: int
     max_batch_size: int
+    dtype: str
 
 # -----------------------------------------------------------------------------
 # Endpoints
@@ -544,16 +1352,21 @@ async def ready():
     }
 
 
-@app.post("/predict", response_model=PredictionResponse)
-async def predict(
-    request: PredictionRequest,
-    req: Request,
-    _: Optional[str] = Depends(verify_api_key)
-):
+# The payload is built as plain dicts and rendered by ORJSONResponse; the
+# model is kept for the OpenAPI schema only, not to re-validate results
+@app.post(
+    "/predict",
+    response_model=None,
+    responses={200: {"model": PredictionResponse}},
+    # Without an API key the dependency is not attached at all
+    dependencies=[Depends(verify_api_key)] if API_KEY else [],
+)
+async def predict(request: PredictionRequest, req: Request):
     """Run inference on input features."""
     request_id = req.state.request_id
     client_ip = req.client.host if req.client else "unknown"
-    start_time = time.time()
+    # Monotonic clock: immune to NTP adjustments, integer nanoseconds
+    start_ns = time.perf_counter_ns()
     success = True
     error_msg = None
 
@@ -561,8 +1374,14 @@ async def predict(
         if not model_wrapper.loaded:
             raise ModelNotLoadedError()
 
-        results = model_wrapper.predict(request.instances)
-        predictions = [PredictionResult(**r) for r in results]
+        features = request.features
+        if isinstance(features, list) and len(features) * len(features[0]) >= PREPARE_OFFLOAD_VALUES:
+            # Converting a large nested list is CPU-bound: keep it off the event
+            # loop (and off the inference thread, which only runs forward passes)
+            features = await asyncio.to_thread(model_wrapper.prepare, features)
+        else:
+            features = model_wrapper.prepare(features)
+        results = await batcher.submit(features)
 
     except InferenceError:
         success = False
@@ -575,24 +1394,24 @@ async def predict(
         raise PredictionError(f"Unexpected error: {str(e)}")
 
     finally:
-        latency = time.time() - start_time
-        metrics.record_request(latency, success, len(request.instances) if success else 0)
+        latency_ns = time.perf_counter_ns() - start_ns
+        metrics.record_request(latency_ns, success, len(request.features) if success else 0)
         AuditLog.log_prediction(
             request_id=request_id,
             client_ip=client_ip,
-            instances_count=len(request.instances),
-            latency_ms=latency * 1000,
+            instances_count=len(request.features),
+            latency_ms=latency_ns / 1e6,
             success=success,
             error=error_msg
         )
 
-    return PredictionResponse(
-        request_id=request_id,
-        predictions=predictions,
-        model_name=MODEL_NAME,
-        model_version=MODEL_VERSION,
-        inference_time_ms=latency * 1000
-    )
+    return ORJSONResponse({
+        "request_id": request_id,
+        "predictions": results,
+        "model_name": MODEL_NAME,
+        "model_version": MODEL_VERSION,
+        "inference_time_ms": latency_ns / 1e6,
+    })
 
 
 @app.get("/model/info", response_model=ModelInfo)
@@ -606,35 +1425,37 @@ async def model_info():
         loaded=model_wrapper.loaded,
         device=model_wrapper.device,
         input_features=model_wrapper.input_features,
-        max_batch_size=MAX_BATCH_SIZE
+        max_batch_size=MAX_BATCH_SIZE,
+        dtype=model_wrapper.weight_dtype
     )
 
 
 @app.get("/metrics", response_class=PlainTextResponse)
 async def prometheus_metrics():
     """Prometheus metrics endpoint."""
-    return metrics.to_prometheus()
+    return PlainTextResponse(metrics.to_prometheus(), media_type=CONTENT_TYPE_LATEST)
 
 
 # -----------------------------------------------------------------------------
 # Error Handlers
 # -----------------------------------------------------------------------------
 
+_STATUS_CODE_MAP = {
+    "MODEL_NOT_LOADED": 503,
+    "MODEL_LOAD_ERROR": 503,
+    "VALIDATION_ERROR": 422,
+    "PREDICTION_ERROR": 500,
+    "AUTHENTICATION_ERROR": 401,
+    "RATE_LIMIT_ERROR": 429,
+}
+
+
 @app.exception_handler(InferenceError)
 async def inference_error_handler(request: Request, exc: InferenceError):
     """Handle custom inference errors with structured response."""
     request_id = getattr(request.state, "request_id", "unknown")
 
-    status_code_map = {
-        "MODEL_NOT_LOADED": 503,
-        "MODEL_LOAD_ERROR": 503,
-        "VALIDATION_ERROR": 422,
-        "PREDICTION_ERROR": 500,
-        "AUTHENTICATION_ERROR": 401,
-        "RATE_LIMIT_ERROR": 429,
-    }
-
-    status_code = status_code_map.get(exc.error_code, 500)
+    status_code = _STATUS_CODE_MAP.get(exc.error_code, 500)
 
     if exc.error_code == "VALIDATION_ERROR":
         metrics.record_validation_error()
@@ -644,10 +1465,10 @@ async def inference_error_handler(request: Request, exc: InferenceError):
         message=exc.message,
         details=exc.details,
         request_id=request_id,
-        timestamp=datetime.utcnow().isoformat() + "Z"
+        timestamp=iso_now()
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status_code,
         content=error_response.model_dump()
     )
@@ -658,17 +1479,17 @@ async def global_exception_handler(request: Request, exc: Exception):
     """Handle unexpected errors with structured response."""
     request_id = getattr(request.state, "request_id", "unknown")
     logger.error(f"Unhandled exception [{request_id}]: {exc}")
-    metrics.error_count += 1
+    metrics.record_error()
 
     error_response = APIError(
         error_code="INTERNAL_ERROR",
         message="An unexpected error occurred",
         details={"exception": str(exc)} if LOG_LEVEL == "DEBUG" else None,
         request_id=request_id,
-        timestamp=datetime.utcnow().isoformat() + "Z"
+        timestamp=iso_now()
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content=error_response.model_dump()
     )
@@ -0,0 +1,59 @@
+"""Shared fixtures for inference service tests."""
+
+import threading
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi.testclient import TestClient
+
+from app.main import app, model_wrapper
+
+
+_load_errors: list[BaseException] = []
+
+
+def _background_load():
+    try:
+        if not model_wrapper.loaded:
+            model_wrapper.load()
+    except BaseException as e:  # re-raised from the fixture on the main thread
+        _load_errors.append(e)
+
+
+_load_thread = threading.Thread(target=_background_load, name="model-load", daemon=True)
+
+
+def pytest_configure(config):
+    # Start loading before collection so the two overlap. The xdist controller
+    # runs no tests, so only workers (or a plain serial run) load the model.
+    is_controller = getattr(config.option, "dist", "no") != "no" and not hasattr(config, "workerinput")
+    if not is_controller:
+        _load_thread.start()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _load_model():
+    """Wait for the background model load before any test runs."""
+    _load_thread.join()
+    if _load_errors:
+        raise _load_errors[0]
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Create one test client (and run the lifespan once) for the whole session.
+
+    Lives here rather than in a test module so every module shares the same
+    lifespan instead of each starting its own.
+    """
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest_asyncio.fixture
+async def aclient(client):
+    """Async client calling the ASGI app directly (the model is loaded via client)."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
@@ -2,138 +2,314 @@
 Tests for ML Inference Service
 ==============================
 Run: pytest src/inference-service/tests/ -v
+
+Classes are independent, so the suite can be sharded per class with
+pytest-xdist: pytest src/inference-service/tests/ -n auto --dist=loadscope
+Each worker is its own process and loads its own model and metrics registry.
 """
 
+import asyncio
+import base64
+import inspect
+import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Any
+
+import numpy as np
+import orjson
 import pytest
-from fastapi.testclient import TestClient
-
-from app.main import app, model_wrapper
-
-
-@pytest.fixture(scope="module")
-def client():
-    """Create test client and ensure model is loaded."""
-    # Load model for tests
-    if not model_wrapper.loaded:
-        model_wrapper.load()
-
-    with TestClient(app) as c:
-        yield c
+import torch
+from fastapi.routing import APIRoute
+from prometheus_client import REGISTRY
+from pydantic import ValidationError as PydanticValidationError
+
+from app.main import (
+    INFER_POOL,
+    MAX_BATCH_SIZE,
+    MAX_FEATURES,
+    MODEL_NAME,
+    MODEL_VERSION,
+    PREDICT_CACHE_SIZE,
+    PREPARE_OFFLOAD_VALUES,
+    AuditLog,
+    AuthenticationError,
+    MicroBatcher,
+    ModelNotLoadedError,
+    PredictionRequest,
+    PredictionResponse,
+    ValidationError,
+    app,
+    audit_logger,
+    batcher,
+    metrics,
+    model_wrapper,
+    verify_api_key,
+)
+
+
+# Request bodies serialised once at import; tests post them with content=
+HDR = {"content-type": "application/json"}
+PAYLOAD_3F = b'{"instances":[[1.0,2.0,3.0]]}'
+PAYLOAD_5F_X3 = b'{"instances":[[1.0,2.0,3.0,4.0,5.0],[5.0,4.0,3.0,2.0,1.0],[0.5,0.5,0.5,0.5,0.5]]}'
+PAYLOAD_EMPTY = b'{"instances":[]}'
+PAYLOAD_INVALID = b'{"invalid_field":"value"}'
+_ROW = b"[1.0,2.0,3.0]"
+# Both sides of the batch size limit share one joined run of rows
+_LIMIT_ROWS = b",".join([_ROW] * MAX_BATCH_SIZE)
+BATCH_AT_LIMIT = b'{"instances":[' + _LIMIT_ROWS + b"]}"
+BATCH_OVER_LIMIT = b'{"instances":[' + _LIMIT_ROWS + b"," + _ROW + b"]}"
+
+
+@pytest.fixture(scope="session")
+def sample_prediction(client):
+    """One successful 3-instance /predict call as (response, body), shared by read-only tests."""
+    response = client.post("/predict", content=PAYLOAD_5F_X3, headers=HDR)
+    return response, _json(response)
+
+
+@pytest.fixture(scope="session")
+def metrics_snapshot(client):
+    """A single /metrics scrape shared by tests that only inspect its format."""
+    return client.get("/metrics")
+
+
+def _json(response) -> Any:
+    """Decode a response body with orjson."""
+    return orjson.loads(response.content)
+
+
+async def asgi_post(path: str, body: bytes) -> int:
+    """POST straight into the ASGI app and return only the response status.
+
+    For status-only assertions: skips the TestClient/httpx layers and drops
+    the response body as it is sent.
+    """
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [
+            (b"host", b"test"),
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ],
+        "client": ("test", 0),
+        "server": ("test", 80),
+    }
+    status = 0
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+def _metric(name: str, **labels: str) -> float:
+    """Current value of a sample read straight from the registry (no text render)."""
+    labels = {"model": MODEL_NAME, "version": MODEL_VERSION, **labels}
+    return REGISTRY.get_sample_value(name, labels) or 0.0
 
 
 class TestHealthEndpoints:
-    """Test health and readiness endpoints."""
+    """Test health, readiness and model info endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_readonly_endpoints(self, aclient):
+        """Read-only endpoints are independent, so they are requested concurrently."""
+        health, ready, info = await asyncio.gather(
+            aclient.get("/health"),
+            aclient.get("/ready"),
+            aclient.get("/model/info"),
+        )
 
-    def test_health_check(self, client):
-        """Health endpoint should return healthy status."""
-        response = client.get("/health")
-        assert response.status_code == 200
-        assert response.json()["status"] == "healthy"
+        # Health endpoint should return healthy status
+        assert health.status_code == 200
+        assert _json(health)["status"] == "healthy"
 
-    def test_ready_check(self, client):
-        """Ready endpoint should return ready when model is loaded."""
-        response = client.get("/ready")
-        assert response.status_code == 200
-        data = response.json()
+        # Ready endpoint should return ready when model is loaded
+        assert ready.status_code == 200
+        data = _json(ready)
         assert data["status"] == "ready"
         assert "model" in data
         assert "version" in data
 
+        # Model info should return model metadata
+        assert info.status_code == 200
+        data = _json(info)
+        assert "name" in data
+        assert "version" in data
+        assert "framework" in data
+        assert "loaded" in data
+        assert "device" in data
+        assert "input_features" in data
+        assert "max_batch_size" in data
+        assert data["dtype"] in ("float32", "float16", "int8")
+        assert data["loaded"] is True
+
 
 class TestPredictionEndpoint:
     """Test prediction endpoint."""
 
-    def test_predict_single_instance(self, client):
-        """Should return prediction for single instance."""
-        response = client.post(
-            "/predict",
-            json={"instances": [[1.0, 2.0, 3.0, 4.0, 5.0]]}
-        )
+    @pytest.mark.parametrize("field", [
+        "request_id",
+        "predictions",
+        "model_name",
+        "model_version",
+        "inference_time_ms",
+    ])
+    def test_predict_response_fields(self, sample_prediction, field):
+        """Prediction response should carry results and model metadata."""
+        response, data = sample_prediction
         assert response.status_code == 200
-        data = response.json()
-        assert len(data["predictions"]) == 1
-        assert "prediction" in data["predictions"][0]
-        assert "confidence" in data["predictions"][0]
-        assert "probabilities" in data["predictions"][0]
-        assert data["inference_time_ms"] > 0
-        assert "request_id" in data
+        assert field in data
 
-    def test_predict_multiple_instances(self, client):
-        """Should return predictions for multiple instances."""
-        response = client.post(
-            "/predict",
-            json={
-                "instances": [
-                    [1.0, 2.0, 3.0, 4.0, 5.0],
-                    [5.0, 4.0, 3.0, 2.0, 1.0],
-                    [0.5, 0.5, 0.5, 0.5, 0.5]
-                ]
-            }
-        )
-        assert response.status_code == 200
-        data = response.json()
+    def test_predict_multiple_instances(self, sample_prediction):
+        """Should return one prediction per instance."""
+        _, data = sample_prediction
         assert len(data["predictions"]) == 3
+        for result in data["predictions"]:
+            assert {"prediction", "confidence", "probabilities"} <= result.keys()
+        assert data["inference_time_ms"] > 0
 
-    def test_predict_includes_model_info(self, client):
-        """Prediction response should include model metadata."""
-        response = client.post(
-            "/predict",
-            json={"instances": [[1.0, 2.0, 3.0, 4.0, 5.0]]}
-        )
+    def test_predict_response_matches_schema(self, sample_prediction):
+        """The hand-built payload should still satisfy the documented response model."""
+        response, data = sample_prediction
+        parsed = PredictionResponse.model_validate(data)
+        assert parsed.request_id == response.headers["X-Request-ID"]
+
+
+class TestInputValidation:
+    """Test input validation for feature vectors."""
+
+    @pytest.mark.asyncio
+    async def test_rejected_with_422(self, client):
+        """Schema violations should surface through the API as 422."""
+        assert await asgi_post("/predict", PAYLOAD_INVALID) == 422
+
+    def test_batch_at_limit(self, client):
+        """Should accept a batch of exactly MAX_BATCH_SIZE instances."""
+        response = client.post("/predict", content=BATCH_AT_LIMIT, headers=HDR)
         assert response.status_code == 200
-        data = response.json()
-        assert "model_name" in data
-        assert "model_version" in data
-        assert "request_id" in data
+        assert len(_json(response)["predictions"]) == MAX_BATCH_SIZE
+
+    @pytest.mark.asyncio
+    async def test_batch_over_limit(self, client):
+        """One instance past MAX_BATCH_SIZE should be rejected."""
+        assert await asgi_post("/predict", BATCH_OVER_LIMIT) == 422
+
+    def test_large_batch_validated_off_loop(self, client, monkeypatch):
+        """Large JSON batches are prepared on a worker thread with the same errors."""
+        on_loop = []
+        prepare = model_wrapper.prepare
+
+        def spy(features):
+            try:
+                asyncio.get_running_loop()
+                on_loop.append(True)
+            except RuntimeError:
+                on_loop.append(False)
+            return prepare(features)
+
+        monkeypatch.setattr(model_wrapper, "prepare", spy)
+
+        # Below PREPARE_OFFLOAD_VALUES the conversion stays inline
+        client.post("/predict", content=PAYLOAD_3F, headers=HDR)
+        batch = [[1.0] * 100 for _ in range(MAX_BATCH_SIZE)]
+        assert MAX_BATCH_SIZE * 100 >= PREPARE_OFFLOAD_VALUES
+        response = client.post("/predict", json={"instances": batch})
+        assert response.status_code == 200
+        assert on_loop == [True, False]
 
-    def test_predict_empty_instances(self, client):
-        """Should return 422 for empty instances list."""
+        # httpx refuses to encode NaN, so send the (Python-accepted) literal by hand
+        batch[5][7] = float("nan")
         response = client.post(
             "/predict",
-            json={"instances": []}
+            content=json.dumps({"instances": batch}),
+            headers={"Content-Type": "application/json"},
         )
         assert response.status_code == 422
-
-    def test_predict_invalid_request(self, client):
-        """Should return 422 for invalid request format."""
-        response = client.post(
+        assert _json(response)["details"]["field"] == "instances[5][7]"
+
+
+class TestPredictionRequestValidation:
+    """Schema rules checked on the request model directly, without the HTTP stack."""
+
+    @pytest.mark.parametrize("payload", [
+        pytest.param({"instances": []}, id="empty-instances"),
+        pytest.param({"invalid_field": "value"}, id="invalid-request"),
+        pytest.param({"instances": [["invalid", 2.0, 3.0]]}, id="string-feature"),
+        pytest.param({"instances": [[1.0, 2.0, 3.0], [1.0, 2.0]]}, id="jagged-instances"),
+        pytest.param({"instances": [[1.0] * (MAX_FEATURES + 1)]}, id="too-many-features"),
+        pytest.param({"instances": [[1.0, 2.0, 3.0]] * (MAX_BATCH_SIZE + 1)}, id="batch-size-limit"),
+    ])
+    def test_rejected(self, payload):
+        """Malformed or out-of-limit requests should fail model validation."""
+        with pytest.raises(PydanticValidationError):
+            PredictionRequest.model_validate(payload)
+
+
+class TestBinaryInstances:
+    """Test base64-encoded float32 instances."""
+
+    @staticmethod
+    def _encode(rows):
+        return base64.b64encode(np.asarray(rows, dtype="<f4").tobytes()).decode()
+
+    def test_predict_b64_matches_json(self, client):
+        """Binary instances should predict the same as JSON instances."""
+        rows = [[1.0, 2.0, 3.0, 4.0, 5.0], [5.0, 4.0, 3.0, 2.0, 1.0]]
+        json_response = client.post("/predict", json={"instances": rows})
+        b64_response = client.post(
             "/predict",
-            json={"invalid_field": "value"}
+            json={"instances_b64": self._encode(rows), "shape": [2, 5]}
         )
-        assert response.status_code == 422
-
-
-class TestInputValidation:
-    """Test input validation for feature vectors."""
+        assert b64_response.status_code == 200
+        assert _json(b64_response)["predictions"] == _json(json_response)["predictions"]
 
-    def test_invalid_feature_type_string(self, client):
-        """Should reject string values in feature vector."""
+    def test_predict_b64_shape_mismatch(self, client):
+        """Should reject a payload whose size does not match the shape."""
         response = client.post(
             "/predict",
-            json={"instances": [["invalid", 2.0, 3.0]]}
+            json={"instances_b64": self._encode([[1.0, 2.0, 3.0]]), "shape": [2, 3]}
         )
         assert response.status_code == 422
 
-    def test_batch_size_limit(self, client):
-        """Should reject batches exceeding MAX_BATCH_SIZE."""
-        # Create 101 instances (default max is 100)
-        large_batch = [[1.0, 2.0, 3.0] for _ in range(101)]
+    def test_predict_b64_non_finite(self, client):
+        """Should reject NaN values in binary instances."""
         response = client.post(
             "/predict",
-            json={"instances": large_batch}
+            json={"instances_b64": self._encode([[1.0, float("nan")]]), "shape": [1, 2]}
         )
         assert response.status_code == 422
+        assert _json(response)["error_code"] == "VALIDATION_ERROR"
 
-    def test_valid_batch_within_limit(self, client):
-        """Should accept batches within MAX_BATCH_SIZE."""
-        # Create 10 instances
-        batch = [[1.0, 2.0, 3.0] for _ in range(10)]
+    def test_predict_both_encodings(self, client):
+        """Should reject requests that provide both encodings."""
         response = client.post(
             "/predict",
-            json={"instances": batch}
+            json={
+                "instances": [[1.0, 2.0, 3.0]],
+                "instances_b64": self._encode([[1.0, 2.0, 3.0]]),
+                "shape": [1, 3]
+            }
         )
-        assert response.status_code == 200
-        assert len(response.json()["predictions"]) == 10
+        assert response.status_code == 422
 
 
 class TestStructuredErrors:
@@ -143,88 +319,382 @@ class TestStructuredErrors:
         """Error responses should have structured format."""
         response = client.post(
             "/predict",
-            json={"instances": []}
+            content=PAYLOAD_EMPTY,
+            headers=HDR
         )
         assert response.status_code == 422
         # Pydantic validation errors have different format
 
-    def test_request_id_in_response(self, client):
+    def test_request_id_in_response(self, sample_prediction):
         """Responses should include X-Request-ID header."""
+        assert "X-Request-ID" in sample_prediction[0].headers
+
+    def test_error_timestamp_is_utc_iso(self, client):
+        """Error timestamps should be ISO 8601 UTC with microseconds."""
         response = client.post(
             "/predict",
-            json={"instances": [[1.0, 2.0, 3.0]]}
+            json={
+                "instances_b64": base64.b64encode(
+                    np.array([[1.0, np.nan]], dtype="<f4").tobytes()
+                ).decode(),
+                "shape": [1, 2],
+            }
         )
-        assert "X-Request-ID" in response.headers
-
-
-class TestModelInfoEndpoint:
-    """Test model info endpoint."""
-
-    def test_model_info(self, client):
-        """Should return model metadata."""
-        response = client.get("/model/info")
-        assert response.status_code == 200
-        data = response.json()
-        assert "name" in data
-        assert "version" in data
-        assert "framework" in data
-        assert "loaded" in data
-        assert "device" in data
-        assert "input_features" in data
-        assert "max_batch_size" in data
-        assert data["loaded"] is True
+        assert response.status_code == 422
+        timestamp = _json(response)["timestamp"]
+        parsed = datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%S.%fZ").replace(tzinfo=timezone.utc)
+        assert abs((datetime.now(timezone.utc) - parsed).total_seconds()) < 60
+
+
+class TestAuditLog:
+    """Test audit log entries."""
+
+    def test_prediction_entry_is_json(self, client):
+        """Audit entries should be emitted as JSON objects."""
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        audit_logger.addHandler(handler)
+        # pytest's own root handlers make logging.basicConfig a no-op here
+        level = audit_logger.level
+        audit_logger.setLevel(logging.INFO)
+        try:
+            response = client.post("/predict", content=PAYLOAD_3F, headers=HDR)
+        finally:
+            audit_logger.setLevel(level)
+            audit_logger.removeHandler(handler)
+
+        entry = json.loads(records[-1].getMessage())
+        assert entry["event"] == "prediction"
+        assert entry["request_id"] == response.headers["X-Request-ID"]
+        assert entry["success"] is True
+
+
+REQUIRED_METRICS = (
+    b"inference_requests_total",
+    b"inference_predictions_total",
+    b"inference_errors_total",
+    b"inference_request_duration_seconds",
+    b"inference_instances_total",
+    b"inference_validation_errors_total",
+)
 
 
 class TestMetricsEndpoint:
     """Test Prometheus metrics endpoint."""
 
-    def test_metrics_format(self, client):
+    def test_metrics_format(self, metrics_snapshot):
         """Metrics should be in Prometheus format."""
-        response = client.get("/metrics")
-        assert response.status_code == 200
-        assert "text/plain" in response.headers["content-type"]
+        assert metrics_snapshot.status_code == 200
+        assert "text/plain" in metrics_snapshot.headers["content-type"]
 
-        content = response.text
-        assert "inference_requests_total" in content
-        assert "inference_predictions_total" in content
-        assert "inference_errors_total" in content
-        assert "inference_request_duration_seconds" in content
-        assert "inference_instances_total" in content
-        assert "inference_validation_errors_total" in content
+        body = metrics_snapshot.content
+        missing = [name for name in REQUIRED_METRICS if name not in body]
+        assert not missing
 
     def test_metrics_increment_after_prediction(self, client):
-        """Metrics should increment after predictions."""
-        # Get initial metrics
-        response1 = client.get("/metrics")
-        initial_content = response1.text
+        """One successful prediction should count exactly once."""
+        before = _metric("inference_predictions_total")
+        requests_before = _metric("inference_requests_total")
+        client.post("/predict", content=PAYLOAD_3F, headers=HDR)
 
-        # Make a prediction
-        client.post("/predict", json={"instances": [[1.0, 2.0, 3.0]]})
+        assert _metric("inference_predictions_total") == before + 1
+        assert _metric("inference_requests_total") == requests_before + 1
 
-        # Get updated metrics
-        response2 = client.get("/metrics")
-        updated_content = response2.text
+    def test_latency_histogram(self, metrics_snapshot):
+        """Metrics should include latency histogram buckets."""
+        assert "inference_request_duration_seconds_bucket" in metrics_snapshot.text
 
-        # Verify metrics changed (simple check - content should differ)
-        assert response1.status_code == 200
-        assert response2.status_code == 200
+    def test_metrics_render_cached_within_ttl(self, client, monkeypatch):
+        """Scrapes within the TTL should reuse one render; TTL 0 always re-renders."""
+        monkeypatch.setattr(metrics, "cache_ttl", 60.0)
+        first = client.get("/metrics").text
+        client.post("/predict", content=PAYLOAD_3F, headers=HDR)
+        assert client.get("/metrics").text == first
 
-    def test_latency_histogram(self, client):
-        """Metrics should include latency histogram buckets."""
-        response = client.get("/metrics")
-        content = response.text
-        assert "inference_request_duration_seconds_bucket" in content
+        monkeypatch.setattr(metrics, "cache_ttl", 0.0)
+        assert client.get("/metrics").text != first
+
+    def test_batch_size_histogram(self, client):
+        """One batched /predict should observe its row count once."""
+        count = _metric("inference_batch_size_count")
+        total = _metric("inference_batch_size_sum")
+        client.post("/predict", content=PAYLOAD_5F_X3, headers=HDR)
+
+        assert _metric("inference_batch_size_count") == count + 1
+        assert _metric("inference_batch_size_sum") == total + 3
 
 
 class TestAuthentication:
     """Test API authentication (when enabled)."""
 
-    def test_predict_without_auth_when_disabled(self, client):
+    def test_predict_without_auth_when_disabled(self, sample_prediction):
         """Should allow requests without API key when auth is disabled."""
-        # Default config has empty API_KEY (auth disabled)
-        response = client.post(
-            "/predict",
-            json={"instances": [[1.0, 2.0, 3.0]]}
+        # Default config has empty API_KEY (auth disabled); the shared request
+        # carries no X-API-Key header
+        assert sample_prediction[0].status_code == 200
+
+    API_KEY = "s3cret-key"
+
+    @pytest.fixture
+    def auth_failures(self, monkeypatch):
+        """Enable auth with API_KEY and record the reason of each audited failure."""
+        monkeypatch.setattr("app.main.API_KEY", self.API_KEY)
+        monkeypatch.setattr("app.main._API_KEY_BYTES", self.API_KEY.encode())
+        reasons = []
+        monkeypatch.setattr(
+            AuditLog, "log_auth_failure", staticmethod(lambda rid, ip, reason: reasons.append(reason))
+        )
+        return reasons
+
+    @staticmethod
+    def _request():
+        """Just enough of a Request for verify_api_key's audit fields."""
+        return SimpleNamespace(
+            state=SimpleNamespace(request_id="req-1"), client=SimpleNamespace(host="10.0.0.1")
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("api_key, reason", [
+        pytest.param(None, "missing_api_key", id="missing"),
+        pytest.param("", "missing_api_key", id="empty"),
+        pytest.param("s3cret-kez", "invalid_api_key", id="wrong"),
+        pytest.param("s3cret-key-extra", "invalid_api_key", id="longer"),
+        # Starlette decodes header bytes as latin-1; must not raise TypeError
+        pytest.param("s3cr\u00e9t-k\u00eay", "invalid_api_key", id="non-ascii"),
+    ])
+    async def test_rejected_keys(self, auth_failures, api_key, reason):
+        """Missing or wrong keys should raise AuthenticationError and be audited."""
+        with pytest.raises(AuthenticationError):
+            await verify_api_key(self._request(), api_key)
+        assert auth_failures == [reason]
+
+    @pytest.mark.asyncio
+    async def test_correct_key_accepted(self, auth_failures):
+        """The configured key should pass and be returned."""
+        assert await verify_api_key(self._request(), self.API_KEY) == self.API_KEY
+        assert auth_failures == []
+
+    def test_auth_dependency_is_async(self):
+        """verify_api_key must stay async so FastAPI runs it on the loop, not a threadpool."""
+        assert inspect.iscoroutinefunction(verify_api_key)
+
+        # Every dependency FastAPI resolves must be async for the same reason
+        pending = [route.dependant for route in app.routes if isinstance(route, APIRoute)]
+        while pending:
+            dependant = pending.pop()
+            for dep in dependant.dependencies:
+                call = dep.call
+                assert inspect.iscoroutinefunction(call) or inspect.iscoroutinefunction(
+                    getattr(call, "__call__", None)
+                ), f"sync dependency {call!r}"
+                pending.append(dep)
+
+
+class TestModelWrapper:
+    """Test model wrapper internals."""
+
+    def test_buffer_reuse_pads_with_zeros(self, client):
+        """Narrow inputs after wide ones must not see stale buffer columns."""
+        narrow = [[1.0, 2.0, 3.0]]
+        expected = model_wrapper.predict(narrow)
+
+        model_wrapper.predict([[9.0] * 12])
+        assert model_wrapper.predict(narrow) == expected
+
+    def test_probabilities_are_normalised(self, client):
+        """Probabilities should sum to one and confidence match the predicted class."""
+        for result in model_wrapper.predict([[1.0, 2.0, 3.0], [-4.0, 0.5, 8.0]]):
+            assert sum(result["probabilities"]) == pytest.approx(1.0)
+            assert result["confidence"] == max(result["probabilities"])
+            assert result["probabilities"][result["prediction"]] == result["confidence"]
+
+    @pytest.mark.skipif(PREDICT_CACHE_SIZE == 0, reason="prediction cache disabled")
+    def test_cache_serves_repeated_rows(self, client, monkeypatch):
+        """Only uncached rows should reach the model, with results in input order."""
+        rows = [[0.5, 1.5], [2.5, 3.5]]
+        model_wrapper._cache.clear()
+        fresh = model_wrapper.predict([[4.5, 5.5]])[0]
+        model_wrapper._cache.clear()
+        first = model_wrapper.predict(rows)
+
+        forwarded = []
+        forward = model_wrapper._forward
+        monkeypatch.setattr(
+            model_wrapper, "_forward", lambda buf, n: forwarded.append(n) or forward(buf, n)
+        )
+
+        mixed = model_wrapper.predict([rows[1], [4.5, 5.5], rows[0]])
+        assert forwarded == [1]
+        assert mixed == [first[1], fresh, first[0]]
+
+    def test_concurrent_predict_from_threads(self, client):
+        """Direct predict() calls from several threads must not corrupt shared buffers."""
+        inputs = [[[float(i + j) for j in range(3 + i % 8)]] * (1 + i % 4) for i in range(32)]
+
+        if model_wrapper._cache is not None:
+            model_wrapper._cache.clear()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            concurrent = list(pool.map(model_wrapper.predict, inputs))
+
+        if model_wrapper._cache is not None:
+            model_wrapper._cache.clear()
+        assert concurrent == [model_wrapper.predict(x) for x in inputs]
+
+    @pytest.mark.skipif(model_wrapper.device != "cpu", reason="ONNX Runtime path is CPU only")
+    def test_onnx_runtime_matches_eager(self, client):
+        """The ONNX Runtime adapter should reproduce the eager model's logits."""
+        for module in ("onnxruntime", "onnx", "onnxscript"):
+            pytest.importorskip(module)
+
+        eager = torch.nn.Sequential(torch.nn.Linear(model_wrapper.input_features, 4)).eval()
+        onnx_model = model_wrapper._onnx_model(eager)
+
+        x = torch.randn(5, model_wrapper.input_features)
+        with torch.inference_mode():
+            assert torch.allclose(onnx_model(x), eager(x), atol=1e-5)
+
+    def test_prepare_locates_invalid_value(self, client):
+        """Vectorised validation should still report the offending element."""
+        assert model_wrapper.prepare([[1, 2], [3, 4]]).dtype == np.float32
+
+        with pytest.raises(ValidationError) as exc:
+            model_wrapper.prepare([[1.0, 2.0], [3.0, "x"]])
+        assert exc.value.details["field"] == "instances[1][1]"
+
+
+class TestMicroBatcher:
+    """Test coalescing of concurrent prediction requests."""
+
+    @pytest.fixture
+    def gated_batcher(self, client, monkeypatch):
+        """A zero-wait batcher whose forward passes block until `release` is set.
+
+        Yields (batcher, started, release, calls): `started` is set once a pass
+        is in the executor and `calls` records the size of each pass.
+        """
+        started, release = threading.Event(), threading.Event()
+        calls = []
+        predict_batch = model_wrapper.predict_batch
+
+        def slow(batch):
+            calls.append(len(batch))
+            started.set()
+            release.wait(5)
+            return predict_batch(batch)
+
+        monkeypatch.setattr(model_wrapper, "predict_batch", slow)
+        yield (
+            MicroBatcher(model_wrapper, MAX_BATCH_SIZE, max_wait_ms=0, executor=INFER_POOL),
+            started,
+            release,
+            calls,
         )
-        # Should succeed since auth is disabled by default
+        # Never leave the shared inference thread blocked
+        release.set()
+
+    def test_concurrent_requests_share_forward_pass(self, client, monkeypatch):
+        """Concurrent submissions should be served by one predict_batch call."""
+        arrays = [model_wrapper.prepare([[float(i)] * 5]) for i in range(3)]
+        expected = model_wrapper.predict_batch(arrays)
+
+        calls = []
+        predict_batch = model_wrapper.predict_batch
+
+        def spy(batch):
+            calls.append(len(batch))
+            return predict_batch(batch)
+
+        monkeypatch.setattr(model_wrapper, "predict_batch", spy)
+        batcher = MicroBatcher(model_wrapper, MAX_BATCH_SIZE, max_wait_ms=50)
+
+        async def run():
+            batcher.start()
+            try:
+                return await asyncio.gather(*(batcher.submit(arr) for arr in arrays))
+            finally:
+                await batcher.stop()
+
+        assert asyncio.run(run()) == expected
+        assert calls == [3]
+
+    def test_idle_dispatch_then_collect_while_busy(self, gated_batcher):
+        """With no wait window, a lone request runs at once and later ones batch behind it."""
+        batcher, started, release, calls = gated_batcher
+        arr = model_wrapper.prepare([[1.0] * 5])
+
+        async def run():
+            batcher.start()
+            try:
+                first = asyncio.create_task(batcher.submit(arr))
+                await asyncio.to_thread(started.wait, 5)
+                rest = [asyncio.create_task(batcher.submit(arr)) for _ in range(2)]
+                await asyncio.sleep(0.01)
+                release.set()
+                await asyncio.wait_for(asyncio.gather(first, *rest), 5)
+            finally:
+                await batcher.stop()
+
+        asyncio.run(run())
+        assert calls == [1, 2]
+
+    def test_cancelled_caller_during_forward_pass(self, gated_batcher):
+        """A caller cancelled mid-batch must not stop the loop for later requests."""
+        batcher, started, release, calls = gated_batcher
+        arr = model_wrapper.prepare([[1.0] * 5])
+
+        async def run():
+            batcher.start()
+            try:
+                doomed = asyncio.create_task(batcher.submit(arr))
+                await asyncio.to_thread(started.wait, 5)
+                doomed.cancel()
+                release.set()
+                with pytest.raises(asyncio.CancelledError):
+                    await doomed
+                # The next request is still batched, not served by the direct fallback
+                result = await asyncio.wait_for(batcher.submit(arr), 5)
+                return result, batcher.running
+            finally:
+                await batcher.stop()
+
+        result, running = asyncio.run(run())
+        assert running
+        assert calls == [1, 1]
+        assert result[0]["prediction"] in (0, 1)
+
+    def test_stop_fails_in_flight_batch(self, gated_batcher):
+        """Stopping the batcher mid-forward pass should fail that batch's callers, not hang them."""
+        batcher, started, _, _ = gated_batcher
+        arr = model_wrapper.prepare([[1.0] * 5])
+
+        async def run():
+            batcher.start()
+            caller = asyncio.create_task(batcher.submit(arr))
+            await asyncio.to_thread(started.wait, 5)
+            await batcher.stop()
+            return await asyncio.wait_for(caller, 1)
+
+        with pytest.raises(ModelNotLoadedError):
+            asyncio.run(run())
+
+
+class TestLatency:
+    """Latency benchmarks for /predict (pytest-benchmark).
+
+    Save a baseline with --benchmark-autosave and gate regressions with
+    --benchmark-compare --benchmark-compare-fail=median:20%. Benchmarks are
+    disabled automatically when the suite runs under xdist.
+    """
+
+    def test_predict_latency(self, benchmark, client, monkeypatch):
+        """Round-trip latency of a single-instance prediction through the forward pass."""
+        # Every round posts the same row: without this each one after the first
+        # would be a cache hit. No batching window, so rounds time the full path.
+        monkeypatch.setattr(model_wrapper, "_cache", None)
+        monkeypatch.setattr(batcher, "max_wait", 0.0)
+        hits = _metric("inference_cache_hits_total")
+
+        response = benchmark(client.post, "/predict", content=PAYLOAD_3F, headers=HDR)
         assert response.status_code == 200
+        assert _metric("inference_cache_hits_total") == hits